@@ -1,7 +1,7 @@
 import torch
 import torch.utils.data
 
-import csv
+import numpy as np
 
 
 class CSVDataset(torch.utils.data.Dataset):
@@ -9,29 +9,25 @@ class CSVDataset(torch.utils.data.Dataset):
     PyTorch dataset for CSV format with the following rows:
     x,y,z,..., class. I.e. a list of coordinates followed by a class.
     Entire dataset is loaded into memory at runtime, so can't be too huge.
+    If device is given the dataset is moved there once at load time.
     """
-    def __init__(self, file, shuffle=True):
-        with open(file) as csvfile:
-            csv_data = list(csv.reader(csvfile, delimiter=','))
-            for i in range(len(csv_data)):
-                for j in range(len(csv_data[1])):
-                    if i != 0:
-                        csv_data[i][j] = float(csv_data[i][j])
-            self.csv_tensor = torch.tensor(csv_data[1:]).float()
-            idx = torch.randperm(self.csv_tensor.shape[0])
-            self.csv_tensor = self.csv_tensor[idx]
+    def __init__(self, file, shuffle=True, device='cpu'):
+        csv_data = np.loadtxt(file, delimiter=',', skiprows=1, dtype=np.float32, ndmin=2)
+        # split into separate feature and label arrays. The class column may be
+        # written as a float (e.g. 1.0), so it is cast rather than parsed as int.
+        features = np.ascontiguousarray(csv_data[:, :-1])
+        labels = csv_data[:, -1].astype(np.int64)
+        idx = torch.randperm(features.shape[0])
+        self.features = torch.from_numpy(features)[idx].to(device)
+        self.labels = torch.from_numpy(labels)[idx].to(device)
         
     def __len__(self):
-        return self.csv_tensor.shape[0]
+        return self.features.shape[0]
     
     def __getitem__(self, index):
         # input, output
-        return self.csv_tensor[index][:-1], self.csv_tensor[index][-1].long()
+        return self.features[index], self.labels[index]
 
 def extract_class(dataset, cls):
-    class_indices = []
-    for i in range(len(dataset)):
-        if dataset[i][1] == cls:
-            class_indices.append(i)
-
+    class_indices = torch.nonzero(dataset.labels == cls).flatten().tolist()
     return torch.utils.data.Subset(dataset, class_indices)
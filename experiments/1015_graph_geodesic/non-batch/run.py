@@ -9,6 +9,7 @@ import numpy as np
 import torch
 import trainer
 from train.extract_data import extract_data
+from train.utils import set_seed
 from activations import compute_activations, save_activations
 from landscape import compute_landscapes, save_landscape
 from diagram import compute_diagrams, save_diagram
@@ -34,6 +35,10 @@ def generate_cli_parser():
                         help='number of epochs to train (default: 14)')
     parser.add_argument('--learning-rate', type=float, default=0.05, metavar='LR',
                         help='learning rate (default: 0.02)')
+    parser.add_argument('--num-workers', type=int, default=0,
+                        help='number of DataLoader worker processes, respawned every epoch (default: 0)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='random seed, training attempt i is seeded with seed+i (default: unseeded)')
     parser.add_argument('--ignore-failed', default=False, action='store_true',
                         help='Do not count failed training (less than training threshold)')
 
@@ -78,6 +83,8 @@ def generate_cli_parser():
 def main(args):
     network = __import__(args.model).Net
     device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    if args.seed is not None:
+        set_seed(args.seed)
     # load data
     dataset = CSVDataset(args.csv_file)
 
@@ -85,8 +92,13 @@ def main(args):
     print("Dataset Samples: {}".format(len(dataset)))
 
     network_id = 0
+    # failed networks are retried under the same network_id, so seed per attempt
+    attempt = 0
     while network_id <= args.network_count:
         status('STATUS: Beginning training of network {}'.format(network_id))
+        if args.seed is not None:
+            set_seed(args.seed + attempt)
+        attempt += 1
         print('Running on device: {}'.format(device))
         
         net = trainer.train(args.model,
@@ -94,7 +106,8 @@ def main(args):
                             args.training_threshold,
                             args.max_epochs,
                             args.batch_size, 
-                            args.learning_rate)
+                            args.learning_rate,
+                            num_workers=args.num_workers)
 
         net.id = network_id
 
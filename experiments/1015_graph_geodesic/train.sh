@@ -1,5 +1,19 @@
+# Usage: train.sh NETWORK_COUNT OUTPUT_FOLDER [JOBS]
+#   JOBS: number of networks to train concurrently (default: 1)
+# Each network writes its snapshots to OUTPUT_FOLDER/network<id>_<threshold>.pt
+# and its training log to OUTPUT_FOLDER/log_network<id>.csv (one log per network,
+# replacing the single OUTPUT_FOLDER/log.csv).
 OUTPUT_FOLDER=$2
 NETWORK_COUNT=$1
+JOBS=${3:-1}
+
+case $JOBS in
+    ''|*[!0-9]*) JOBS=0 ;;
+esac
+if [ "$JOBS" -lt 1 ]; then
+    echo ERROR: JOBS must be a positive integer.
+    exit 1
+fi
 
 for net_id in $(seq 1 $NETWORK_COUNT);
 do
@@ -12,6 +26,10 @@ do
         --max-epochs 8000 \
         --learning-rate 0.001 \
         --output-name $OUTPUT_FOLDER/network${net_id} \
-        --log-name $OUTPUT_FOLDER/log.csv \
-        ;
+        --log-name $OUTPUT_FOLDER/log_network${net_id}.csv \
+        &
+    if [ $((net_id % JOBS)) -eq 0 ]; then
+        wait
+    fi
 done
+wait
@@ -5,11 +5,21 @@ from skorch.net import NeuralNet
 from skorch import NeuralNetClassifier
 from skorch.callbacks import EpochScoring, LRScheduler
 from train.callbacks import TrainingThreshold
+from train.utils import set_seed
 
 import os
 import sys
 from csv_loader import CSVDataset
 
+class AutocastNeuralNetClassifier(NeuralNetClassifier):
+    """
+    NeuralNetClassifier whose forward pass runs under CUDA bfloat16 autocast.
+    Outputs are cast back to float32 before the loss is computed.
+    """
+    def infer(self, x, **fit_params):
+        with torch.autocast(device_type='cuda', dtype=torch.bfloat16):
+            return super().infer(x, **fit_params).float()
+
 def train(model_fname,
           dataset,
           training_threshold,
@@ -18,13 +28,18 @@ def train(model_fname,
           batch_size,
           learning_rate,
           output_prefix,
-          log_file):
+          log_file,
+          num_workers=0,
+          amp=False):
 
-    sys.path.append(os.path.dirname(model_fname))
+    # train() is called once per network, only extend sys.path the first time
+    model_dir = os.path.dirname(model_fname)
+    if model_dir not in sys.path:
+        sys.path.append(model_dir)
     network = __import__(os.path.basename(model_fname)).Net
     device = 'cuda' if torch.cuda.is_available() else 'cpu'
     # load data
-    y_train = np.array([y for X, y in iter(dataset)])
+    y_train = dataset.labels.cpu().numpy()
 
     # Prepare training callback
     training_accuracy = EpochScoring('accuracy',
@@ -45,8 +60,29 @@ def train(model_fname,
                  test_accuracy,
                  training_threshold]
     
+    # DataLoader settings, shared by the training and validation iterators.
+    # skorch builds new DataLoaders every epoch, so workers are respawned each
+    # epoch and persistent_workers/prefetch_factor would have no effect.
+    # A dataset already living on the GPU is indexed in place, so workers and
+    # pinning would only add overhead.
+    if dataset.features.is_cuda:
+        num_workers = 0
+    iterator_kwargs = {'num_workers': num_workers,
+                       'pin_memory': device == 'cuda' and not dataset.features.is_cuda}
+    net_params = {}
+    for key, value in iterator_kwargs.items():
+        net_params['iterator_train__' + key] = value
+        net_params['iterator_valid__' + key] = value
+
+    # fused Adam on CUDA, otherwise the multi-tensor (foreach) implementation
+    if device == 'cuda':
+        net_params['optimizer__fused'] = True
+    else:
+        net_params['optimizer__foreach'] = True
+
     # initalize the network
-    net = NeuralNetClassifier(
+    net_class = AutocastNeuralNetClassifier if amp and device == 'cuda' else NeuralNetClassifier
+    net = net_class(
         network,
         criterion=torch.nn.CrossEntropyLoss,
         max_epochs=max_epochs,
@@ -55,7 +91,8 @@ def train(model_fname,
         lr=learning_rate,
         callbacks=callbacks,
         iterator_train__shuffle=True,
-        device=device)
+        device=device,
+        **net_params)
 
     net.set_params(callbacks__valid_acc=None)
     net.fit(X=dataset, y=y_train)
@@ -79,11 +116,20 @@ if __name__=='__main__':
                         help='number of epochs to train (default: 1024)')
     parser.add_argument('--learning-rate', type=float, default=0.02, metavar='LR',
                         help='learning rate (default: 0.02)')
+    parser.add_argument('--num-workers', type=int, default=0,
+                        help='number of DataLoader worker processes, respawned every epoch (default: 0)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='random seed (default: unseeded)')
+    parser.add_argument('--amp', default=False, action='store_true',
+                        help='Run the forward pass in bfloat16 autocast on CUDA.')
     parser.add_argument('--output-name', type=str)
     parser.add_argument('--log-name', type=str)
     
     args = parser.parse_args()
-    dataset = CSVDataset(args.csv_file)
+    if args.seed is not None:
+        set_seed(args.seed)
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    dataset = CSVDataset(args.csv_file, device=device)
 
     net = train(args.model,
                 dataset,
@@ -93,7 +139,9 @@ if __name__=='__main__':
                 args.batch_size,
                 args.learning_rate,
                 args.output_name,
-                args.log_name)
+                args.log_name,
+                args.num_workers,
+                args.amp)
 
     final_training_acc = net.history[-1, 'Training_Accuracy']
     final_testing_acc = net.history[-1, 'Test_Accuracy']
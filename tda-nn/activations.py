@@ -19,7 +19,7 @@ def compute_activations(net,
 
     activations = []
     module.eval()
-    with torch.no_grad():
+    with torch.inference_mode():
         for n in layers:
             xn = module(data, n)
             activations.append(xn)
@@ -43,7 +43,8 @@ if __name__=='__main__':
             np.random.shuffle(data_numpy)
             data = torch.from_numpy(data_numpy).float()
         elif os.path.splitext(fname)[1] == '.csv':
-            data_numpy = np.loadtxt(fname, delimiter=',')
+            # parse straight to float32, .float() below is then a no-op instead of a copy
+            data_numpy = np.loadtxt(fname, delimiter=',', dtype=np.float32)
             np.random.shuffle(data_numpy)
             data = torch.from_numpy(data_numpy).float()
         else:
@@ -67,14 +68,15 @@ if __name__=='__main__':
     # load network and data
     sys.path.append(args.models_dir)
     model = torch.load(args.network, map_location=torch.device(args.device)).to(args.device)
-    data = load_data(args.input_data).to(args.device)
+    data = load_data(args.input_data)
     # data preprocessing
     if args.persistence_class != -1:
         class_data = data[data[:,-1]==args.persistence_class]
     else:
         class_data = data
 
-    final_data = class_data[:args.sample_count, :-1]
+    # the feature columns are a strided view, make them contiguous before the copy to device
+    final_data = class_data[:args.sample_count, :-1].contiguous().to(args.device)
     # save activations
     activations = compute_activations(model, final_data, args.layers, args.device)
     save_activations(activations, args.output_dir)
@@ -94,11 +94,12 @@ def average(landscapes):
     mean = np.zeros([max_levels, samples])
 
     for landscape in landscapes:
-        # zero pad to match dimensions. Equivalent to saying that non-present levels
-        # are constant zero functions.
-        mean += np.pad(landscape[1], ((0, max_levels-landscape[1].shape[0]), (0,0)) )
+        # accumulate into the leading rows of the preallocated mean. Equivalent to zero
+        # padding, i.e. saying that non-present levels are constant zero functions.
+        mean[:landscape[1].shape[0]] += landscape[1]
 
-    return landscapes[0][0], mean/len(landscapes)
+    mean /= len(landscapes)
+    return landscapes[0][0], mean
 
 def load_landscape(dirname):
     max_layer, max_dim = 0, 0
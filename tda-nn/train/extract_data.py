@@ -1,17 +1,25 @@
 import torch
-import random
 
 def extract_data(dataset, samples, of_class=None):
-    index_list = []
-    for i in range(len(dataset)):
-        if of_class is -1 or dataset[i][1].item() == of_class:
-            index_list.append(i)
+    """
+    Inputs:
+    dataset: dataset exposing a features tensor [N, D] and a labels tensor [N],
+             e.g. CSVDataset. Generic Datasets and Subsets are not supported.
+    samples: number of samples to draw.
+    of_class: class to draw samples from (-1 for all classes).
 
-    random.shuffle(index_list)
+    Outputs:
+    data: tensor [samples, D] of randomly drawn features.
+    """
+    if of_class == -1:
+        index_list = torch.arange(len(dataset), device=dataset.labels.device)
+    else:
+        index_list = torch.nonzero(dataset.labels == of_class).flatten()
 
-    tensor_list = []
-    for i in range(samples):
-        tensor_list.append(dataset[index_list[i]][0].unsqueeze(0))
+    if index_list.shape[0] < samples:
+        raise ValueError("Requested {} samples of class {}, but only {} are available.".format(
+            samples, of_class, index_list.shape[0]))
 
-    return torch.cat(tensor_list)
+    perm = torch.randperm(index_list.shape[0], device=index_list.device)
+    return dataset.features[index_list[perm[:samples]]]
 
@@ -13,3 +13,9 @@ def dataset_to_tensor(dataset):
     return torch.stack(inputs, dim=0), torch.stack(outputs, dim=0)
 
 
+def set_seed(seed):
+    # seed every RNG used during training, on CPU and all CUDA devices
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    torch.cuda.manual_seed_all(seed)
+
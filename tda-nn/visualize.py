@@ -82,10 +82,8 @@ def plot_activations(data, adjacency_matrix, save=None):
 
     plt.scatter(new_data[:,0], new_data[:,1])
     if adjacency_matrix is not None:
-        for i in range(adjacency_matrix.shape[0]):
-            for j in range(adjacency_matrix.shape[1]):
-                if adjacency_matrix[i, j] == 1:
-                    plt.plot((new_data[i, 0], new_data[j, 0]), (new_data[i, 1], new_data[j, 1]))
+        for i, j in zip(*np.nonzero(adjacency_matrix == 1)):
+            plt.plot((new_data[i, 0], new_data[j, 0]), (new_data[i, 1], new_data[j, 1]))
 
     if save is None:
         plt.show()